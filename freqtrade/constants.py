@@ -245,6 +245,7 @@ CONF_SCHEMA = {
                 'token': {'type': 'string'},
                 'chat_id': {'type': 'string'},
                 'balance_dust_level': {'type': 'number', 'minimum': 0.0},
+                'poll_timeout': {'type': 'integer', 'minimum': 1},
                 'notification_settings': {
                     'type': 'object',
                     'default': {},
@@ -310,6 +311,7 @@ CONF_SCHEMA = {
                 'process_throttle_secs': {'type': 'integer'},
                 'interval': {'type': 'integer'},
                 'sd_notify': {'type': 'boolean'},
+                'status_fetch_workers': {'type': 'integer', 'minimum': 1},
             }
         },
         'dataformat_ohlcv': {
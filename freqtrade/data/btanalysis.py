@@ -188,26 +188,34 @@ def load_backtest_data(filename: Union[Path, str], strategy: Optional[str] = Non
 
 def analyze_trade_parallelism(results: pd.DataFrame, timeframe: str) -> pd.DataFrame:
     """
-    Find overlapping trades by expanding each trade once per period it was open
-    and then counting overlaps.
+    Find overlapping trades by counting, for each period, the trades open during it.
+    A trade counts once per period from its open_date up to and including its close_date.
     :param results: Results Dataframe - can be loaded
     :param timeframe: Timeframe used for backtest
     :return: dataframe with open-counts per time-period in timeframe
     """
     from freqtrade.exchange import timeframe_to_minutes
-    timeframe_min = timeframe_to_minutes(timeframe)
-    dates = [pd.Series(pd.date_range(row[1]['open_date'], row[1]['close_date'],
-                                     freq=f"{timeframe_min}min"))
-             for row in results[['open_date', 'close_date']].iterrows()]
-    deltas = [len(x) for x in dates]
-    dates = pd.Series(pd.concat(dates).values, name='date')
-    df2 = pd.DataFrame(np.repeat(results.values, deltas, axis=0), columns=results.columns)
-
-    df2 = pd.concat([dates, df2], axis=1)
-    df2 = df2.set_index('date')
-    df_final = df2.resample(f"{timeframe_min}min")[['pair']].count()
-    df_final = df_final.rename({'pair': 'open_trades'}, axis=1)
-    return df_final
+    if results.empty:
+        return pd.DataFrame({'open_trades': pd.Series(dtype=np.int64)},
+                            index=pd.DatetimeIndex([], name='date'))
+    freq = pd.Timedelta(minutes=timeframe_to_minutes(timeframe))
+    # .values drops the timezone - the resulting index is naive UTC
+    open_dates = pd.DatetimeIndex(results['open_date'].values)
+    close_dates = pd.DatetimeIndex(results['close_date'].values)
+    # Align periods the same way resample() does - starting at midnight of the first day
+    origin = open_dates.min().normalize()
+    start = np.asarray((open_dates - origin) // freq, dtype=np.int64)
+    end = start + np.asarray((close_dates - open_dates) // freq, dtype=np.int64) + 1
+
+    # Sweep-line: +1 where a trade starts, -1 after its last period
+    first = start.min()
+    periods = end.max() - first
+    diff = np.zeros(periods + 1, dtype=np.int64)
+    np.add.at(diff, start - first, 1)
+    np.add.at(diff, end - first, -1)
+
+    index = pd.date_range(origin + first * freq, periods=periods, freq=freq, name='date')
+    return pd.DataFrame({'open_trades': diff[:-1].cumsum()}, index=index)
 
 
 def evaluate_result_multi(results: pd.DataFrame, timeframe: str,
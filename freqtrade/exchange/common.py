@@ -14,6 +14,14 @@ logger = logging.getLogger(__name__)
 API_RETRY_COUNT = 4
 API_FETCH_ORDER_RETRY_COUNT = 5
 
+# Connection pool of the synchronous ccxt session.
+# Connections are kept alive between calls, and several requests may run concurrently.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
+
+# Seconds a single ticker may be reused by fetch_ticker(cached=True)
+TICKER_CACHE_TTL = 1
+
 BAD_EXCHANGES = {
     "bitmex": "Various reasons.",
     "bitstamp": "Does not provide history. "
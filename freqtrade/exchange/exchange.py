@@ -18,6 +18,8 @@ from cachetools import TTLCache
 from ccxt.base.decimal_to_precision import (ROUND_DOWN, ROUND_UP, TICK_SIZE, TRUNCATE,
                                             decimal_to_precision)
 from pandas import DataFrame
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 from freqtrade.constants import DEFAULT_AMOUNT_RESERVE_PERCENT, ListPairsWithTimeframes
 from freqtrade.data.converter import ohlcv_to_dataframe, trades_dict_to_list
@@ -25,8 +27,9 @@ from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFun
                                   InvalidOrderException, OperationalException, RetryableOrderError,
                                   TemporaryError)
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, BAD_EXCHANGES,
-                                       EXCHANGE_HAS_OPTIONAL, EXCHANGE_HAS_REQUIRED, retrier,
-                                       retrier_async)
+                                       EXCHANGE_HAS_OPTIONAL, EXCHANGE_HAS_REQUIRED,
+                                       HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, TICKER_CACHE_TTL,
+                                       retrier, retrier_async)
 from freqtrade.misc import deep_merge_dicts, safe_value_fallback2
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 
@@ -88,6 +91,8 @@ class Exchange:
 
         # Cache for 10 minutes ...
         self._fetch_tickers_cache: TTLCache = TTLCache(maxsize=1, ttl=60 * 10)
+        # Single tickers are only reused for a very short time
+        self._fetch_ticker_cache: TTLCache = TTLCache(maxsize=1000, ttl=TICKER_CACHE_TTL)
 
         # Holds candles
         self._klines: Dict[Tuple[str, str], DataFrame] = {}
@@ -192,6 +197,16 @@ class Exchange:
 
         self.set_sandbox(api, exchange_config, name)
 
+        # The sync ccxt api reuses one requests session - size its connection pool
+        # so that concurrent calls don't need to open new connections.
+        # Retries are left to freqtrade's retrier.
+        session = getattr(api, 'session', None)
+        if isinstance(session, Session):
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                                  pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
         return api
 
     @property
@@ -624,6 +639,8 @@ class Exchange:
     def buy(self, pair: str, ordertype: str, amount: float,
             rate: float, time_in_force: str) -> Dict:
 
+        # Our own order may move the price - don't reuse the cached ticker
+        self._fetch_ticker_cache.pop(pair, None)
         if self._config['dry_run']:
             dry_order = self.create_dry_run_order(pair, ordertype, "buy", amount, rate)
             return dry_order
@@ -637,6 +654,8 @@ class Exchange:
     def sell(self, pair: str, ordertype: str, amount: float,
              rate: float, time_in_force: str = 'gtc') -> Dict:
 
+        # Our own order may move the price - don't reuse the cached ticker
+        self._fetch_ticker_cache.pop(pair, None)
         if self._config['dry_run']:
             dry_order = self.create_dry_run_order(pair, ordertype, "sell", amount, rate)
             return dry_order
@@ -714,12 +733,22 @@ class Exchange:
             raise OperationalException(e) from e
 
     @retrier
-    def fetch_ticker(self, pair: str) -> dict:
+    def fetch_ticker(self, pair: str, cached: bool = False) -> dict:
+        """
+        :param pair: Pair to get the ticker for
+        :param cached: Allow a ticker fetched within the last TICKER_CACHE_TTL seconds
+        :return: fetch_ticker result
+        """
+        if cached:
+            ticker = self._fetch_ticker_cache.get(pair)
+            if ticker:
+                return ticker
         try:
             if (pair not in self.markets or
                     self.markets[pair].get('active', False) is False):
                 raise ExchangeError(f"Pair {pair} not available")
             data = self._api.fetch_ticker(pair)
+            self._fetch_ticker_cache[pair] = data
             return data
         except ccxt.DDoSProtection as e:
             raise DDosProtection(e) from e
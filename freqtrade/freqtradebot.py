@@ -19,7 +19,7 @@ from freqtrade.data.converter import order_book_to_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.edge import Edge
 from freqtrade.exceptions import (DependencyException, ExchangeError, InsufficientFundsError,
-                                  InvalidOrderException, PricingError)
+                                  InvalidOrderException, OperationalException, PricingError)
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
@@ -240,7 +240,7 @@ class FreqtradeBot(LoggingMixin):
         Return the number of free open trades slots or 0 if
         max number of open trades reached
         """
-        open_trades = len(Trade.get_open_trades())
+        open_trades = Trade.get_open_trade_count()
         return max(0, self.config['max_open_trades'] - open_trades)
 
     def update_open_orders(self):
@@ -429,7 +429,7 @@ class FreqtradeBot(LoggingMixin):
             used_rate = rate_from_l2
         else:
             logger.info(f"Using Last {bid_strategy['price_side'].capitalize()} / Last Price")
-            ticker = self.exchange.fetch_ticker(pair)
+            ticker = self.exchange.fetch_ticker(pair, cached=not refresh)
             ticker_rate = ticker[bid_strategy['price_side']]
             if ticker['last'] and ticker_rate > ticker['last']:
                 balance = bid_strategy['ask_last_balance']
@@ -758,18 +758,49 @@ class FreqtradeBot(LoggingMixin):
                 logger.warning("Sell Price at location from orderbook could not be determined.")
                 raise PricingError from e
         else:
-            ticker = self.exchange.fetch_ticker(pair)
-            ticker_rate = ticker[ask_strategy['price_side']]
-            if ticker['last'] and ticker_rate < ticker['last']:
-                balance = ask_strategy.get('bid_last_balance', 0.0)
-                ticker_rate = ticker_rate - balance * (ticker_rate - ticker['last'])
-            rate = ticker_rate
+            rate = self._sell_rate_from_ticker(self.exchange.fetch_ticker(pair, cached=not refresh))
 
         if rate is None:
             raise PricingError(f"Sell-Rate for {pair} was empty.")
         self._sell_rate_cache[pair] = rate
         return rate
 
+    def _sell_rate_from_ticker(self, ticker: Dict[str, Any]) -> Optional[float]:
+        """
+        Calculate the sell rate from a ticker, based on the ask_strategy settings
+        """
+        ask_strategy = self.config.get('ask_strategy', {})
+        ticker_rate = ticker[ask_strategy['price_side']]
+        if ticker['last'] and ticker_rate < ticker['last']:
+            balance = ask_strategy.get('bid_last_balance', 0.0)
+            ticker_rate = ticker_rate - balance * (ticker_rate - ticker['last'])
+        return ticker_rate
+
+    def refresh_sell_rates(self, pairs: List[str]) -> None:
+        """
+        Fill the sell rate cache for all pairs without a cached rate using one
+        fetch_tickers call, instead of one fetch_ticker call per pair.
+        Only used if rates are taken from the ticker and the exchange supports fetching
+        tickers in batch. Pairs which can't be populated are left to get_sell_rate().
+        :param pairs: Pairs to get rates for
+        """
+        missing = [pair for pair in set(pairs) if not self._sell_rate_cache.get(pair)]
+        if (len(missing) < 2
+                or self.config.get('ask_strategy', {}).get('use_order_book', False)
+                or not self.exchange.exchange_has('fetchTickers')):
+            return
+        try:
+            tickers = self.exchange.get_tickers()
+        except (ExchangeError, OperationalException) as e:
+            logger.warning(f"Could not fetch tickers in batch: {e}")
+            return
+        for pair in missing:
+            ticker = tickers.get(pair)
+            if ticker:
+                rate = self._sell_rate_from_ticker(ticker)
+                if rate is not None:
+                    self._sell_rate_cache[pair] = rate
+
     def handle_trade(self, trade: Trade) -> bool:
         """
         Sells the current pair if the threshold is reached and updates the trade record.
@@ -1115,6 +1146,7 @@ class FreqtradeBot(LoggingMixin):
             trade.close_date = None
             trade.is_open = True
             trade.open_order_id = None
+            self.rpc.reset_pair_performance()
         else:
             # TODO: figure out how to handle partially complete sell orders
             reason = constants.CANCEL_REASON['PARTIALLY_FILLED_KEEP_OPEN']
@@ -1363,6 +1395,7 @@ class FreqtradeBot(LoggingMixin):
 
         # Updating wallets when order is closed
         if not trade.is_open:
+            self.rpc.reset_pair_performance()
             if not stoploss_order and not trade.open_order_id:
                 self._notify_sell(trade, '', True)
             self.protections.stop_per_pair(trade.pair)
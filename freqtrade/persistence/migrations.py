@@ -123,6 +123,17 @@ def migrate_open_orders_to_trades(engine):
         """)
 
 
+def create_missing_indexes(decl_base, inspector, engine, table_name: str) -> None:
+    """
+    Create indexes which were added to the model after the table was created.
+    """
+    existing = [index['name'] for index in inspector.get_indexes(table_name)]
+    for index in decl_base.metadata.tables[table_name].indexes:
+        if index.name not in existing:
+            logger.info(f'Creating index {index.name} on {table_name}.')
+            index.create(engine)
+
+
 def check_migrate(engine, decl_base, previous_tables) -> None:
     """
     Checks if migration is necessary and migrates if necessary
@@ -141,6 +152,8 @@ def check_migrate(engine, decl_base, previous_tables) -> None:
         inspector = inspect(engine)
         cols = inspector.get_columns('trades')
 
+    create_missing_indexes(decl_base, inspector, engine, 'trades')
+
     if 'orders' not in previous_tables and 'trades' in previous_tables:
         logger.info('Moving open orders to Orders table.')
         migrate_open_orders_to_trades(engine)
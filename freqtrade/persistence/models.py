@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Integer, String,
+from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String,
                         create_engine, desc, func, inspect)
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.declarative import declarative_base
@@ -621,6 +621,15 @@ class LocalTrade():
         """
         return Trade.get_trades_proxy(is_open=True)
 
+    @staticmethod
+    def get_open_trade_count() -> int:
+        """
+        Count open trades without loading them
+        """
+        if Trade.use_db:
+            return Trade.query.filter(Trade.is_open.is_(True)).count()
+        return len(LocalTrade.trades_open)
+
     @staticmethod
     def stoploss_reinitialization(desired_stoploss):
         """
@@ -649,6 +658,8 @@ class Trade(_DECL_BASE, LocalTrade):
     Note: Fields must be aligned with LocalTrade class
     """
     __tablename__ = 'trades'
+    # Supports the lookback queries of protections (e.g. StoplossGuard)
+    __table_args__ = (Index('ix_trades_guard', 'is_open', 'close_date', 'sell_reason'),)
 
     use_db: bool = True
 
@@ -830,15 +841,19 @@ class Trade(_DECL_BASE, LocalTrade):
         ]
 
     @staticmethod
-    def get_best_pair():
+    def get_best_pair(start_date: Optional[datetime] = None):
         """
         Get best pair with closed trade.
         NOTE: Not supported in Backtesting.
+        :param start_date: Only consider trades closed after this date
         :returns: Tuple containing (pair, profit_sum)
         """
+        filters = [Trade.is_open.is_(False)]
+        if start_date:
+            filters.append(Trade.close_date >= start_date)
         best_pair = Trade.query.with_entities(
             Trade.pair, func.sum(Trade.close_profit).label('profit_sum')
-        ).filter(Trade.is_open.is_(False)) \
+        ).filter(*filters) \
             .group_by(Trade.pair) \
             .order_by(desc('profit_sum')).first()
         return best_pair
@@ -474,11 +474,13 @@ def generate_profit_graph(pairs: str, data: Dict[str, pd.DataFrame],
     fig = add_profit(fig, 2, df_comb, 'cum_profit', 'Profit')
     fig = add_max_drawdown(fig, 2, trades, df_comb, timeframe)
 
+    # Split trades by pair once instead of scanning all trades for every pair
+    trades_by_pair = dict(tuple(trades.groupby('pair')))
     for pair in pairs:
         profit_col = f'cum_profit_{pair}'
         try:
-            df_comb = create_cum_profit(df_comb, trades[trades['pair'] == pair], profit_col,
-                                        timeframe)
+            df_comb = create_cum_profit(df_comb, trades_by_pair.get(pair, trades.iloc[0:0]),
+                                        profit_col, timeframe)
             fig = add_profit(fig, 3, df_comb, profit_col, f"Profit {pair}")
         except ValueError:
             pass
@@ -533,6 +535,7 @@ def load_and_plot_trades(config: Dict[str, Any]):
     plot_elements = init_plotscript(config, list(exchange.markets), strategy.startup_candle_count)
     timerange = plot_elements['timerange']
     trades = plot_elements['trades']
+    trades_by_pair = dict(tuple(trades.groupby('pair')))
     pair_counter = 0
     for pair, data in plot_elements["ohlcv"].items():
         pair_counter += 1
@@ -540,7 +543,7 @@ def load_and_plot_trades(config: Dict[str, Any]):
 
         df_analyzed = strategy.analyze_ticker(data, {'pair': pair})
         df_analyzed = trim_dataframe(df_analyzed, timerange)
-        trades_pair = trades.loc[trades['pair'] == pair]
+        trades_pair = trades_by_pair.get(pair, trades.iloc[0:0])
         trades_pair = extract_trades_of_period(df_analyzed, trades_pair)
 
         fig = generate_candlestick_graph(
@@ -98,6 +98,13 @@ class IProtection(LoggingMixin, ABC):
         Get lock end time
         """
         max_date: datetime = max([trade.close_date for trade in trades if trade.close_date])
+        return IProtection.calculate_lock_end_from_date(max_date, stop_minutes)
+
+    @staticmethod
+    def calculate_lock_end_from_date(max_date: datetime, stop_minutes: int) -> datetime:
+        """
+        Get lock end time based on the close date of the last relevant trade
+        """
         # comming from Database, tzinfo is not set.
         if max_date.tzinfo is None:
             max_date = max_date.replace(tzinfo=timezone.utc)
@@ -3,6 +3,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
+from sqlalchemy import func
+
 from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 from freqtrade.strategy.interface import SellType
@@ -10,6 +12,9 @@ from freqtrade.strategy.interface import SellType
 
 logger = logging.getLogger(__name__)
 
+STOPLOSS_SELL_REASONS = (SellType.TRAILING_STOP_LOSS.value, SellType.STOP_LOSS.value,
+                         SellType.STOPLOSS_ON_EXCHANGE.value)
+
 
 class StoplossGuard(IProtection):
 
@@ -21,6 +26,12 @@ class StoplossGuard(IProtection):
 
         self._trade_limit = protection_config.get('trade_limit', 10)
         self._disable_global_stop = protection_config.get('only_per_pair', False)
+        # Static part of the database filter - only the lookback date changes per call
+        self._stoploss_filters = [
+            Trade.is_open.is_(False),
+            Trade.sell_reason.in_(STOPLOSS_SELL_REASONS),
+            Trade.close_profit < 0,
+        ]
 
     def short_desc(self) -> str:
         """
@@ -41,29 +52,31 @@ class StoplossGuard(IProtection):
         Evaluate recent trades
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
-        # filters = [
-        #     Trade.is_open.is_(False),
-        #     Trade.close_date > look_back_until,
-        #     or_(Trade.sell_reason == SellType.STOP_LOSS.value,
-        #         and_(Trade.sell_reason == SellType.TRAILING_STOP_LOSS.value,
-        #              Trade.close_profit < 0))
-        # ]
-        # if pair:
-        #     filters.append(Trade.pair == pair)
-        # trades = Trade.get_trades(filters).all()
-
-        trades1 = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        trades = [trade for trade in trades1 if (str(trade.sell_reason) in (
-                    SellType.TRAILING_STOP_LOSS.value, SellType.STOP_LOSS.value,
-                    SellType.STOPLOSS_ON_EXCHANGE.value)
+
+        if Trade.use_db:
+            # Let the database filter for stoploss trades instead of loading
+            # all recently closed trades
+            filters = [*self._stoploss_filters, Trade.close_date > look_back_until]
+            if pair:
+                filters.append(Trade.pair == pair)
+            # Count and lock end (last close date) in one single-row query
+            trade_count, last_close_date = Trade.get_trades(filters).with_entities(
+                func.count(Trade.id), func.max(Trade.close_date)).one()
+            if trade_count < self._trade_limit:
+                return False, None, None
+            until = self.calculate_lock_end_from_date(last_close_date, self._stop_duration)
+        else:
+            trades1 = Trade.get_trades_proxy(pair=pair, is_open=False,
+                                             close_date=look_back_until)
+            trades = [trade for trade in trades1 if (str(trade.sell_reason) in STOPLOSS_SELL_REASONS
                       and trade.close_profit and trade.close_profit < 0)]
 
-        if len(trades) < self._trade_limit:
-            return False, None, None
+            if len(trades) < self._trade_limit:
+                return False, None, None
+            until = self.calculate_lock_end(trades, self._stop_duration)
 
         self.log_once(f"Trading stopped due to {self._trade_limit} "
                       f"stoplosses within {self._lookback_period} minutes.", logger.info)
-        until = self.calculate_lock_end(trades, self._stop_duration)
         return True, until, self._reason()
 
     def global_stop(self, date_now: datetime) -> ProtectionReturn:
@@ -3,14 +3,18 @@ This module contains class to define a RPC communications
 """
 import logging
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from math import isnan
+from threading import Lock
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import arrow
-from numpy import NAN, inf, int64, mean
+from cachetools import TTLCache
+from numpy import NAN, inf, int64
 from pandas import DataFrame
+from sqlalchemy import and_, case, func, or_
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.constants import CANCEL_REASON, DATETIME_PRINT_FORMAT
@@ -112,6 +116,9 @@ class RPC:
         self._config: Dict[str, Any] = freqtrade.config
         if self._config.get('fiat_display_currency', None):
             self._fiat_converter = CryptoToFiatConverter()
+        # Per-pair performance for /performance - shared with the api server thread
+        self._pair_performance_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
+        self._pair_performance_lock = Lock()
 
     @staticmethod
     def _rpc_show_config(config, botstate: Union[State, str]) -> Dict[str, Any]:
@@ -149,6 +156,44 @@ class RPC:
         }
         return val
 
+    def _fetch_open_orders(self, trades: List[Trade]) -> Dict[int, Dict]:
+        """
+        Fetch the open orders of the given trades from the exchange.
+        Orders are fetched concurrently, using up to `internals.status_fetch_workers` threads.
+        :return: Dict of trade_id -> order
+        """
+        # Read the ORM attributes here - worker threads must not touch the session's objects
+        open_orders = [(trade.id, trade.open_order_id, trade.pair)
+                       for trade in trades if trade.open_order_id]
+        workers = self._freqtrade.config.get('internals', {}).get('status_fetch_workers', 4)
+        max_workers = min(len(open_orders), workers)
+        if max_workers <= 1:
+            return {trade_id: self._freqtrade.exchange.fetch_order(order_id, pair)
+                    for trade_id, order_id, pair in open_orders}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            orders = executor.map(
+                lambda o: self._freqtrade.exchange.fetch_order(o[1], o[2]), open_orders)
+            return {o[0]: order for o, order in zip(open_orders, orders)}
+
+    def _get_pair_performance(self) -> List[Dict[str, Any]]:
+        """
+        Performance of closed trades per pair, best pair first.
+        Cached for a few seconds, and reset whenever a trade is closed, re-opened
+        or deleted.
+        """
+        with self._pair_performance_lock:
+            performance = self._pair_performance_cache.get('performance')
+            if performance is None:
+                performance = Trade.get_overall_performance()
+                self._pair_performance_cache['performance'] = performance
+            return performance
+
+    def reset_pair_performance(self) -> None:
+        """ Drop the cached pair performance """
+        with self._pair_performance_lock:
+            self._pair_performance_cache.clear()
+
     def _rpc_trade_status(self, trade_ids: List[int] = []) -> List[Dict[str, Any]]:
         """
         Below follows the RPC backend it is prefixed with rpc_ to raise awareness that it is
@@ -164,10 +209,10 @@ class RPC:
             raise RPCException('no active trade')
         else:
             results = []
+            self._freqtrade.refresh_sell_rates([trade.pair for trade in trades if trade.is_open])
+            orders = self._fetch_open_orders(trades)
             for trade in trades:
-                order = None
-                if trade.open_order_id:
-                    order = self._freqtrade.exchange.fetch_order(trade.open_order_id, trade.pair)
+                order = orders.get(trade.id)
                 # calculate profit and send message to user
                 if trade.is_open:
                     try:
@@ -226,6 +271,7 @@ class RPC:
             raise RPCException('no active trade')
         else:
             trades_list = []
+            self._freqtrade.refresh_sell_rates([trade.pair for trade in trades])
             for trade in trades:
                 # calculate profit and send message to user
                 try:
@@ -269,16 +315,14 @@ class RPC:
 
         for day in range(0, timescale):
             profitday = today - timedelta(days=day)
-            trades = Trade.get_trades(trade_filter=[
+            curdayprofit, trade_count = Trade.get_trades(trade_filter=[
                 Trade.is_open.is_(False),
                 Trade.close_date >= profitday,
                 Trade.close_date < (profitday + timedelta(days=1))
-            ]).order_by(Trade.close_date).all()
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None)
+            ]).with_entities(func.sum(Trade.close_profit_abs), func.count(Trade.id)).one()
             profit_days[profitday] = {
-                'amount': curdayprofit,
-                'trades': len(trades)
+                'amount': curdayprofit or 0,
+                'trades': trade_count
             }
 
         data = [
@@ -322,27 +366,28 @@ class RPC:
         """
         Generate generic stats for trades in database
         """
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
+        def trade_win_loss(close_profit):
+            if close_profit > 0:
                 return 'wins'
-            elif trade.close_profit < 0:
+            elif close_profit < 0:
                 return 'losses'
             else:
                 return 'draws'
-        trades = trades = Trade.get_trades([Trade.is_open.is_(False)])
-        # Sell reason
+        # Only the columns used below are loaded - no need for full Trade objects
+        trades = Trade.get_trades([Trade.is_open.is_(False)]).with_entities(
+            Trade.sell_reason, Trade.close_profit, Trade.open_date, Trade.close_date).all()
         sell_reasons = {}
-        for trade in trades:
-            if trade.sell_reason not in sell_reasons:
-                sell_reasons[trade.sell_reason] = {'wins': 0, 'losses': 0, 'draws': 0}
-            sell_reasons[trade.sell_reason][trade_win_loss(trade)] += 1
-
-        # Duration
         dur: Dict[str, List[int]] = {'wins': [], 'draws': [], 'losses': []}
-        for trade in trades:
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
+        for sell_reason, close_profit, open_date, close_date in trades:
+            result = trade_win_loss(close_profit)
+            # Sell reason
+            if sell_reason not in sell_reasons:
+                sell_reasons[sell_reason] = {'wins': 0, 'losses': 0, 'draws': 0}
+            sell_reasons[sell_reason][result] += 1
+
+            # Duration
+            if close_date is not None and open_date is not None:
+                dur[result].append((close_date - open_date).total_seconds())
 
         wins_dur = sum(dur['wins']) / len(dur['wins']) if len(dur['wins']) > 0 else 'N/A'
         draws_dur = sum(dur['draws']) / len(dur['draws']) if len(dur['draws']) > 0 else 'N/A'
@@ -352,53 +397,67 @@ class RPC:
         return {'sell_reasons': sell_reasons, 'durations': durations}
 
     def _rpc_trade_statistics(
-            self, stake_currency: str, fiat_display_currency: str) -> Dict[str, Any]:
-        """ Returns cumulative profit statistics """
-        trades = Trade.get_trades().order_by(Trade.id).all()
-
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-
-        for trade in trades:
-            current_rate: float = 0.0
-
-            if not trade.open_rate:
-                continue
-            if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit
-                profit_closed_coin.append(trade.close_profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if trade.close_profit >= 0:
-                    winning_trades += 1
-                else:
-                    losing_trades += 1
-            else:
-                # Get current rate
-                try:
-                    current_rate = self._freqtrade.get_sell_rate(trade.pair, False)
-                except (PricingError, ExchangeError):
-                    current_rate = NAN
-                profit_ratio = trade.calc_profit_ratio(rate=current_rate)
+            self, stake_currency: str, fiat_display_currency: str,
+            start_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Returns cumulative profit statistics
+        :param start_date: Only include trades closed after this date (and all open trades).
+            The first trade date is always based on all trades.
+        """
+        trade_filter = []
+        if start_date:
+            trade_filter.append(or_(Trade.is_open.is_(True), Trade.close_date >= start_date))
+        closed_filter = and_(Trade.is_open.is_(False), Trade.open_rate > 0)
+        # Aggregate closed trades within the database instead of loading every trade
+        (trade_count, closed_trade_count, first_date, last_date,
+         closed_count, profit_closed_coin_sum, profit_closed_ratio_sum,
+         profit_closed_calc_sum, winning_trades) = Trade.query.filter(*trade_filter).with_entities(
+            func.count(Trade.id),
+            func.count(case([(Trade.is_open.is_(False), Trade.id)])),
+            func.min(Trade.open_date),
+            func.max(Trade.open_date),
+            func.count(case([(closed_filter, Trade.id)])),
+            func.sum(case([(closed_filter, Trade.close_profit_abs)])),
+            func.sum(case([(closed_filter, Trade.close_profit)])),
+            # Equivalent of trade.calc_profit() using the close rate
+            func.sum(case([(closed_filter,
+                            Trade.amount * func.coalesce(Trade.close_rate, 0)
+                            * (1 - Trade.fee_close) - Trade.open_trade_value)])),
+            func.count(case([(and_(closed_filter, Trade.close_profit >= 0), Trade.id)])),
+        ).one()
+        if start_date:
+            first_date = Trade.query.with_entities(func.min(Trade.open_date)).scalar()
+        losing_trades = closed_count - winning_trades
+        profit_closed_coin_sum = profit_closed_coin_sum or 0.0
+        profit_closed_ratio_sum = profit_closed_ratio_sum or 0.0
+        profit_closed_calc_sum = profit_closed_calc_sum or 0.0
+
+        durations = [
+            (close_date - open_date).total_seconds()
+            for open_date, close_date in Trade.query.with_entities(
+                Trade.open_date, Trade.close_date
+            ).filter(closed_filter, Trade.close_date.isnot(None), *trade_filter)
+        ]
 
-            profit_all_coin.append(
-                trade.calc_profit(rate=trade.close_rate or current_rate)
-            )
-            profit_all_ratio.append(profit_ratio)
+        profit_open_coin = []
+        profit_open_ratio = []
+        # Only open trades require the current rate - load these as full objects
+        open_trades = Trade.get_trades([Trade.is_open.is_(True), Trade.open_rate > 0]).all()
+        self._freqtrade.refresh_sell_rates([trade.pair for trade in open_trades])
+        for trade in open_trades:
+            try:
+                current_rate = self._freqtrade.get_sell_rate(trade.pair, False)
+            except (PricingError, ExchangeError):
+                current_rate = NAN
+            profit_open_coin.append(trade.calc_profit(rate=current_rate))
+            profit_open_ratio.append(trade.calc_profit_ratio(rate=current_rate))
 
-        best_pair = Trade.get_best_pair()
+        best_pair = Trade.get_best_pair(start_date)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(profit_closed_coin_sum, 8)
+        profit_closed_ratio_mean = (profit_closed_ratio_sum / closed_count
+                                    if closed_count else 0.0)
 
         profit_closed_fiat = self._fiat_converter.convert_amount(
             profit_closed_coin_sum,
@@ -406,17 +465,17 @@ class RPC:
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_coin_sum = round(profit_closed_calc_sum + sum(profit_open_coin), 8)
+        profit_all_ratio_sum = profit_closed_ratio_sum + sum(profit_open_ratio)
+        profit_all_count = closed_count + len(profit_open_ratio)
+        profit_all_ratio_mean = (profit_all_ratio_sum / profit_all_count
+                                 if profit_all_count else 0.0)
         profit_all_fiat = self._fiat_converter.convert_amount(
             profit_all_coin_sum,
             stake_currency,
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        first_date = trades[0].open_date if trades else None
-        last_date = trades[-1].open_date if trades else None
         num = float(len(durations) or 1)
         return {
             'profit_closed_coin': profit_closed_coin_sum,
@@ -431,8 +490,8 @@ class RPC:
             'profit_all_percent_sum': round(profit_all_ratio_sum * 100, 2),
             'profit_all_ratio_sum': profit_all_ratio_sum,
             'profit_all_fiat': profit_all_fiat,
-            'trade_count': len(trades),
-            'closed_trade_count': len([t for t in trades if not t.is_open]),
+            'trade_count': trade_count,
+            'closed_trade_count': closed_trade_count,
             'first_trade_date': arrow.get(first_date).humanize() if first_date else '',
             'first_trade_timestamp': int(first_date.timestamp() * 1000) if first_date else 0,
             'latest_trade_date': arrow.get(last_date).humanize() if last_date else '',
@@ -668,6 +727,7 @@ class RPC:
                     pass
 
             trade.delete()
+            self.reset_pair_performance()
             self._freqtrade.wallets.update()
             return {
                 'result': 'success',
@@ -681,22 +741,22 @@ class RPC:
         Handler for performance.
         Shows a performance statistic from finished trades
         """
-        pair_rates = Trade.get_overall_performance()
-        # Round and convert to %
-        [x.update({'profit': round(x['profit'] * 100, 2)}) for x in pair_rates]
-        return pair_rates
+        # Round and convert to % - without modifying the cached values
+        return [{**x, 'profit': round(x['profit'] * 100, 2)} for x in self._get_pair_performance()]
 
     def _rpc_count(self) -> Dict[str, float]:
         """ Returns the number of trades running """
         if self._freqtrade.state != State.RUNNING:
             raise RPCException('trader is not running')
 
-        trades = Trade.get_open_trades()
+        current, total_stake = Trade.query.with_entities(
+            func.count(Trade.id), func.sum(Trade.open_rate * Trade.amount)
+        ).filter(Trade.is_open.is_(True)).one()
         return {
-            'current': len(trades),
+            'current': current,
             'max': (int(self._freqtrade.config['max_open_trades'])
                     if self._freqtrade.config['max_open_trades'] != float('inf') else -1),
-            'total_stake': sum((trade.open_rate * trade.amount) for trade in trades)
+            'total_stake': total_stake or 0
         }
 
     def _rpc_locks(self) -> Dict[str, Any]:
@@ -67,6 +67,10 @@ class RPCManager:
             except NotImplementedError:
                 logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
 
+    def reset_pair_performance(self) -> None:
+        """ Drop the cached pair performance - to be called when trades close or re-open """
+        self._rpc.reset_pair_performance()
+
     def startup_messages(self, config: Dict[str, Any], pairlist, protections) -> None:
         if config['dry_run']:
             self.send_msg({
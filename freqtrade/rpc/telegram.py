@@ -5,7 +5,8 @@ This module manage Telegram communication
 """
 import json
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import wraps
 from html import escape
 from itertools import chain
 from typing import Any, Callable, Dict, List, Union
@@ -29,6 +30,67 @@ logger = logging.getLogger(__name__)
 logger.debug('Included module rpc.telegram ...')
 
 MAX_TELEGRAM_MESSAGE_LENGTH = 4096
+# Upper limit for the long polling timeout allowed by Telegram
+MAX_TELEGRAM_POLL_TIMEOUT = 50
+
+# Message templates, filled using str.format_map()
+STATUS_HEAD_TMPL = (
+    "*Current Pair:* {pair}\n"
+    "*Trade ID:* `{trade_id}`\n"
+    "*Duration:* `{duration} ({duration_min:.1f} min)`\n"
+    "*Amount:* `{amount} ({stake_amount} {base_currency})`\n"
+    "*Open Rate:* `{open_rate:.8f}`"
+)
+STATUS_CLOSE_RATE_TMPL = "*Close Rate:* `{close_rate}`"
+STATUS_CURRENT_PROFIT_TMPL = (
+    "*Current Rate:* `{current_rate:.8f}`\n"
+    "*Current Profit:* `{profit_pct:.2f}%`"
+)
+STATUS_CLOSE_PROFIT_TMPL = (
+    "*Current Rate:* `{current_rate:.8f}`\n"
+    "*Close Profit: *`{profit_pct:.2f}%`"
+)
+STATUS_INITIAL_STOPLOSS_TMPL = (
+    "*Initial Stoploss:* `{initial_stop_loss_abs:.8f}` `({initial_stop_loss_pct:.2f}%)`"
+)
+STATUS_STOPLOSS_TMPL = "*Stoploss:* `{stop_loss_abs:.8f}` "
+STATUS_STOPLOSS_PCT_TMPL = "*Stoploss:* `{stop_loss_abs:.8f}` `({stop_loss_pct:.2f}%)`"
+STATUS_STOPLOSS_DIST_TMPL = (
+    "*Stoploss distance:* `{stoploss_current_dist:.8f}` `({stoploss_current_dist_pct:.2f}%)`"
+)
+STATUS_OPEN_ORDER_TMPL = "*Open Order:* `{open_order}`"
+STATUS_OPEN_SELL_ORDER_TMPL = "*Open Order:* `{open_order}` - `{sell_order_status}`"
+
+PROFIT_CLOSED_TMPL = (
+    "*ROI:* Closed trades\n"
+    "∙ `{profit_closed_coin} ({profit_closed_percent_mean:.2f}%) "
+    "({profit_closed_percent_sum} \N{GREEK CAPITAL LETTER SIGMA}%)`\n"
+    "∙ `{profit_closed_fiat}`\n"
+)
+PROFIT_ALL_TMPL = (
+    "*ROI:* All trades\n"
+    "∙ `{profit_all_coin} ({profit_all_percent_mean:.2f}%) "
+    "({profit_all_percent_sum} \N{GREEK CAPITAL LETTER SIGMA}%)`\n"
+    "∙ `{profit_all_fiat}`\n"
+    "*Total Trade Count:* `{trade_count}`\n"
+    "*First Trade opened:* `{first_trade_date}`\n"
+    "*Latest Trade opened:* `{latest_trade_date}\n`"
+    "*Win / Loss:* `{winning_trades} / {losing_trades}`"
+)
+PROFIT_BEST_TMPL = (
+    "\n*Avg. Duration:* `{avg_duration}`\n"
+    "*Best Performing:* `{best_pair}: {best_rate:.2f}%`"
+)
+
+BALANCE_CURRENCY_TMPL = (
+    "*{currency}:*\n"
+    "\t`Available: {free:.8f}`\n"
+    "\t`Balance: {balance:.8f}`\n"
+    "\t`Pending: {used:.8f}`\n"
+    "\t`Est. {stake}: {est_stake_rounded}`\n"
+)
+
+PERFORMANCE_ROW_TMPL = "{0}.\t <code>{pair}\t{profit:.2f}% ({count})</code>\n"
 
 
 def authorized_only(command_handler: Callable[..., None]) -> Callable[..., Any]:
@@ -38,19 +100,18 @@ def authorized_only(command_handler: Callable[..., None]) -> Callable[..., Any]:
     :return: decorated function
     """
 
-    def wrapper(self, *args, **kwargs):
+    @wraps(command_handler)
+    def wrapper(self, update: Update, context: CallbackContext):
         """ Decorator logic """
-        update = kwargs.get('update') or args[0]
-
         # Reject unauthorized messages
-        chat_id = int(self._config['telegram']['chat_id'])
+        chat_id = self._chat_id
 
         if int(update.message.chat_id) != chat_id:
             logger.info(
                 'Rejected unauthorized message from: %s',
                 update.message.chat_id
             )
-            return wrapper
+            return None
 
         logger.info(
             'Executing handler: %s for chat_id: %s',
@@ -58,7 +119,7 @@ def authorized_only(command_handler: Callable[..., None]) -> Callable[..., Any]:
             chat_id
         )
         try:
-            return command_handler(self, *args, **kwargs)
+            return command_handler(self, update, context)
         except BaseException:
             logger.exception('Exception occurred within Telegram module')
 
@@ -79,6 +140,8 @@ class Telegram(RPCHandler):
         super().__init__(rpc, config)
 
         self._updater: Updater
+        # Parsed once, used to authorize every incoming command
+        self._chat_id = int(self._config['telegram']['chat_id'])
         self._init_keyboard()
         self._init()
 
@@ -162,7 +225,9 @@ class Telegram(RPCHandler):
             self._updater.start_polling(
                 drop_pending_updates=True,
                 bootstrap_retries=-1,
-                timeout=30,
+                poll_interval=0.0,
+                timeout=min(self._config['telegram'].get('poll_timeout', 20),
+                            MAX_TELEGRAM_POLL_TIMEOUT),
                 read_latency=60,
             )
             logger.info(
@@ -312,36 +377,25 @@ class Telegram(RPCHandler):
             for r in results:
                 r['duration'] = arrow.now().replace(microsecond=0) - arrow.get(r['open_date']).replace(microsecond=0)
                 r['duration_min'] = r['duration'].total_seconds() / 60
-                lines = [
-                    "*Current Pair:* {pair}",
-                    "*Trade ID:* `{trade_id}`",
-                    "*Duration:* `{duration} ({duration_min:.1f} min)`\n"
-                    "*Amount:* `{amount} ({stake_amount} {base_currency})`",
-                    "*Open Rate:* `{open_rate:.8f}`",
-                    "*Close Rate:* `{close_rate}`" if r['close_rate'] else "",
-                    "*Current Rate:* `{current_rate:.8f}`",
-                    ("*Current Profit:* " if r['is_open'] else "*Close Profit: *")
-                    + "`{profit_pct:.2f}%`",
-                ]
+                lines = [STATUS_HEAD_TMPL]
+                if r['close_rate']:
+                    lines.append(STATUS_CLOSE_RATE_TMPL)
+                lines.append(STATUS_CURRENT_PROFIT_TMPL if r['is_open']
+                             else STATUS_CLOSE_PROFIT_TMPL)
                 if (r['stop_loss_abs'] != r['initial_stop_loss_abs']
                         and r['initial_stop_loss_pct'] is not None):
                     # Adding initial stoploss only if it is different from stoploss
-                    lines.append("*Initial Stoploss:* `{initial_stop_loss_abs:.8f}` "
-                                 "`({initial_stop_loss_pct:.2f}%)`")
+                    lines.append(STATUS_INITIAL_STOPLOSS_TMPL)
 
                 # Adding stoploss and stoploss percentage only if it is not None
-                lines.append("*Stoploss:* `{stop_loss_abs:.8f}` " +
-                             ("`({stop_loss_pct:.2f}%)`" if r['stop_loss_pct'] else ""))
-                lines.append("*Stoploss distance:* `{stoploss_current_dist:.8f}` "
-                             "`({stoploss_current_dist_pct:.2f}%)`")
+                lines.append(STATUS_STOPLOSS_PCT_TMPL if r['stop_loss_pct']
+                             else STATUS_STOPLOSS_TMPL)
+                lines.append(STATUS_STOPLOSS_DIST_TMPL)
                 if r['open_order']:
-                    if r['sell_order_status']:
-                        lines.append("*Open Order:* `{open_order}` - `{sell_order_status}`")
-                    else:
-                        lines.append("*Open Order:* `{open_order}`")
+                    lines.append(STATUS_OPEN_SELL_ORDER_TMPL if r['sell_order_status']
+                                 else STATUS_OPEN_ORDER_TMPL)
 
-                # Filter empty lines using list-comprehension
-                messages.append("\n".join([line for line in lines if line]).format(**r))
+                messages.append("\n".join(lines).format_map(r))
 
             for msg in messages:
                 self._send_msg(msg)
@@ -417,7 +471,7 @@ class Telegram(RPCHandler):
     @authorized_only
     def _profit(self, update: Update, context: CallbackContext) -> None:
         """
-        Handler for /profit.
+        Handler for /profit [days].
         Returns a cumulative profit statistics.
         :param bot: telegram bot
         :param update: message update
@@ -426,49 +480,34 @@ class Telegram(RPCHandler):
         stake_cur = self._config['stake_currency']
         fiat_disp_cur = self._config.get('fiat_display_currency', '')
 
+        start_date = None
+        try:
+            days = int(context.args[0]) if context.args else 0
+            if days > 0:
+                start_date = datetime.utcnow() - timedelta(days=days)
+        except (TypeError, ValueError, IndexError):
+            pass
+
         stats = self._rpc._rpc_trade_statistics(
             stake_cur,
-            fiat_disp_cur)
-        profit_closed_coin = stats['profit_closed_coin']
-        profit_closed_percent_mean = stats['profit_closed_percent_mean']
-        profit_closed_percent_sum = stats['profit_closed_percent_sum']
-        profit_closed_fiat = stats['profit_closed_fiat']
-        profit_all_coin = stats['profit_all_coin']
-        profit_all_percent_mean = stats['profit_all_percent_mean']
-        profit_all_percent_sum = stats['profit_all_percent_sum']
-        profit_all_fiat = stats['profit_all_fiat']
-        trade_count = stats['trade_count']
-        first_trade_date = stats['first_trade_date']
-        latest_trade_date = stats['latest_trade_date']
-        avg_duration = stats['avg_duration']
-        best_pair = stats['best_pair']
-        best_rate = stats['best_rate']
+            fiat_disp_cur,
+            start_date)
         if stats['trade_count'] == 0:
             markdown_msg = 'No trades yet.'
         else:
+            values = {
+                **stats,
+                'profit_closed_coin': round_coin_value(stats['profit_closed_coin'], stake_cur),
+                'profit_closed_fiat': round_coin_value(stats['profit_closed_fiat'], fiat_disp_cur),
+                'profit_all_coin': round_coin_value(stats['profit_all_coin'], stake_cur),
+                'profit_all_fiat': round_coin_value(stats['profit_all_fiat'], fiat_disp_cur),
+            }
             # Message to display
             if stats['closed_trade_count'] > 0:
-                markdown_msg = ("*ROI:* Closed trades\n"
-                                f"∙ `{round_coin_value(profit_closed_coin, stake_cur)} "
-                                f"({profit_closed_percent_mean:.2f}%) "
-                                f"({profit_closed_percent_sum} \N{GREEK CAPITAL LETTER SIGMA}%)`\n"
-                                f"∙ `{round_coin_value(profit_closed_fiat, fiat_disp_cur)}`\n")
+                markdown_msg = (PROFIT_CLOSED_TMPL + PROFIT_ALL_TMPL
+                                + PROFIT_BEST_TMPL).format_map(values)
             else:
-                markdown_msg = "`No closed trade` \n"
-
-            markdown_msg += (f"*ROI:* All trades\n"
-                             f"∙ `{round_coin_value(profit_all_coin, stake_cur)} "
-                             f"({profit_all_percent_mean:.2f}%) "
-                             f"({profit_all_percent_sum} \N{GREEK CAPITAL LETTER SIGMA}%)`\n"
-                             f"∙ `{round_coin_value(profit_all_fiat, fiat_disp_cur)}`\n"
-                             f"*Total Trade Count:* `{trade_count}`\n"
-                             f"*First Trade opened:* `{first_trade_date}`\n"
-                             f"*Latest Trade opened:* `{latest_trade_date}\n`"
-                             f"*Win / Loss:* `{stats['winning_trades']} / {stats['losing_trades']}`"
-                             )
-            if stats['closed_trade_count'] > 0:
-                markdown_msg += (f"\n*Avg. Duration:* `{avg_duration}`\n"
-                                 f"*Best Performing:* `{best_pair}: {best_rate:.2f}%`")
+                markdown_msg = "`No closed trade` \n" + PROFIT_ALL_TMPL.format_map(values)
         self._send_msg(markdown_msg)
 
     @authorized_only
@@ -534,13 +573,10 @@ class Telegram(RPCHandler):
                 )
             for curr in result['currencies']:
                 if curr['est_stake'] > balance_dust_level:
-                    curr_output = (
-                        f"*{curr['currency']}:*\n"
-                        f"\t`Available: {curr['free']:.8f}`\n"
-                        f"\t`Balance: {curr['balance']:.8f}`\n"
-                        f"\t`Pending: {curr['used']:.8f}`\n"
-                        f"\t`Est. {curr['stake']}: "
-                        f"{round_coin_value(curr['est_stake'], curr['stake'], False)}`\n")
+                    curr_output = BALANCE_CURRENCY_TMPL.format(
+                        est_stake_rounded=round_coin_value(curr['est_stake'], curr['stake'],
+                                                           False),
+                        **curr)
                 else:
                     curr_output = (f"*{curr['currency']}:* not showing <{balance_dust_level} "
                                    f"{curr['stake']} amount \n")
@@ -716,8 +752,7 @@ class Telegram(RPCHandler):
             trades = self._rpc._rpc_performance()
             output = "<b>Performance:</b>\n"
             for i, trade in enumerate(trades):
-                stat_line = (f"{i+1}.\t <code>{trade['pair']}\t{trade['profit']:.2f}% "
-                             f"({trade['count']})</code>\n")
+                stat_line = PERFORMANCE_ROW_TMPL.format(i + 1, **trade)
 
                 if len(output + stat_line) >= MAX_TELEGRAM_MESSAGE_LENGTH:
                     self._send_msg(output, parse_mode=ParseMode.HTML)
@@ -892,7 +927,8 @@ class Telegram(RPCHandler):
                    "                `pending buy orders are marked with an asterisk (*)`\n"
                    "                `pending sell orders are marked with a double asterisk (**)`\n"
                    "*/trades [limit]:* `Lists last closed trades (limited to 10 by default)`\n"
-                   "*/profit:* `Lists cumulative profit from all finished trades`\n"
+                   "*/profit [<n>]:* `Lists cumulative profit from all finished trades, "
+                   "over the last n days`\n"
                    "*/forcesell <trade_id>|all|profit|loss:* `Instantly sells the given trade or all trades, "
                    "regardless of profit, or only all profit or loss trades`\n"
                    f"{forcebuy_text if self._config.get('forcebuy_enable', False) else ''}"
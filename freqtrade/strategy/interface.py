@@ -152,7 +152,9 @@ class IStrategy(ABC, HyperStrategyMixin):
     def __init__(self, config: dict) -> None:
         self.config = config
         # Rename terminal title for better UX
-        mode = "D" if self.config['runmode']==RunMode.DRY_RUN else "L" if self.config['runmode']==RunMode.LIVE else "BT" if self.config['runmode']==RunMode.BACKTEST else ""
+        runmode = self.config.get('runmode')
+        mode = ("D" if runmode == RunMode.DRY_RUN else "L" if runmode == RunMode.LIVE
+                else "BT" if runmode == RunMode.BACKTEST else "")
         if mode:
             system(f'Title {mode} - {self.get_strategy_name()}')
         # Dict to determine if analysis is necessary
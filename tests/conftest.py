@@ -55,6 +55,12 @@ def log_has(line, logs):
                   False)
 
 
+def log_missing(lines, logs):
+    # Lines not found in the captured logs - a single pass over the records for all lines
+    seen = {x[2] for x in logs.record_tuples}
+    return [line for line in lines if line not in seen]
+
+
 def log_has_re(line, logs):
     return reduce(lambda a, b: a or b,
                   filter(lambda x: re.match(line, x[2]), logs.record_tuples),
@@ -2,9 +2,10 @@ from math import isclose
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from arrow import Arrow
-from pandas import DataFrame, DateOffset, Timestamp, to_datetime
+from pandas import DataFrame, DateOffset, DatetimeIndex, Timestamp, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import LAST_BT_RESULT_FN
@@ -178,6 +179,17 @@ def test_analyze_trade_parallelism(default_conf, mocker, testdatadir):
     assert res['open_trades'].min() == 0
 
 
+def test_analyze_trade_parallelism_empty(testdatadir):
+    bt_data = load_backtest_data(testdatadir / "backtest-result_test.json").iloc[0:0]
+
+    res = analyze_trade_parallelism(bt_data, "5m")
+    assert isinstance(res, DataFrame)
+    assert res.empty
+    assert isinstance(res.index, DatetimeIndex)
+    assert res.index.name == 'date'
+    assert res['open_trades'].dtype == np.int64
+
+
 def test_load_trades(default_conf, mocker):
     db_mock = mocker.patch("freqtrade.data.btanalysis.load_trades_from_db", MagicMock())
     bt_mock = mocker.patch("freqtrade.data.btanalysis.load_backtest_data", MagicMock())
@@ -14,7 +14,7 @@ from freqtrade.exceptions import (DDosProtection, DependencyException, InvalidOr
                                   OperationalException, TemporaryError)
 from freqtrade.exchange import Binance, Bittrex, Exchange, Kraken
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, API_RETRY_COUNT,
-                                       calculate_backoff)
+                                       HTTP_POOL_MAXSIZE, calculate_backoff)
 from freqtrade.exchange.exchange import (market_is_active, timeframe_to_minutes, timeframe_to_msecs,
                                          timeframe_to_next_date, timeframe_to_prev_date,
                                          timeframe_to_seconds)
@@ -29,22 +29,21 @@ EXCHANGES = ['bittrex', 'binance', 'kraken', 'ftx']
 def ccxt_exceptionhandlers(mocker, default_conf, api_mock, exchange_name,
                            fun, mock_ccxt_fun, retries=API_RETRY_COUNT + 1, **kwargs):
 
+    # The exchange wraps api_mock - so one exchange serves all cases below
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, id=exchange_name)
     with patch('freqtrade.exchange.common.time.sleep'):
         with pytest.raises(DDosProtection):
             api_mock.__dict__[mock_ccxt_fun] = MagicMock(side_effect=ccxt.DDoSProtection("DDos"))
-            exchange = get_patched_exchange(mocker, default_conf, api_mock, id=exchange_name)
             getattr(exchange, fun)(**kwargs)
         assert api_mock.__dict__[mock_ccxt_fun].call_count == retries
 
     with pytest.raises(TemporaryError):
         api_mock.__dict__[mock_ccxt_fun] = MagicMock(side_effect=ccxt.NetworkError("DeaDBeef"))
-        exchange = get_patched_exchange(mocker, default_conf, api_mock, id=exchange_name)
         getattr(exchange, fun)(**kwargs)
     assert api_mock.__dict__[mock_ccxt_fun].call_count == retries
 
     with pytest.raises(OperationalException):
         api_mock.__dict__[mock_ccxt_fun] = MagicMock(side_effect=ccxt.BaseError("DeadBeef"))
-        exchange = get_patched_exchange(mocker, default_conf, api_mock, id=exchange_name)
         getattr(exchange, fun)(**kwargs)
     assert api_mock.__dict__[mock_ccxt_fun].call_count == 1
 
@@ -52,22 +51,20 @@ def ccxt_exceptionhandlers(mocker, default_conf, api_mock, exchange_name,
 async def async_ccxt_exception(mocker, default_conf, api_mock, fun, mock_ccxt_fun,
                                retries=API_RETRY_COUNT + 1, **kwargs):
 
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
     with patch('freqtrade.exchange.common.asyncio.sleep', get_mock_coro(None)):
         with pytest.raises(DDosProtection):
             api_mock.__dict__[mock_ccxt_fun] = MagicMock(side_effect=ccxt.DDoSProtection("Dooh"))
-            exchange = get_patched_exchange(mocker, default_conf, api_mock)
             await getattr(exchange, fun)(**kwargs)
         assert api_mock.__dict__[mock_ccxt_fun].call_count == retries
 
     with pytest.raises(TemporaryError):
         api_mock.__dict__[mock_ccxt_fun] = MagicMock(side_effect=ccxt.NetworkError("DeadBeef"))
-        exchange = get_patched_exchange(mocker, default_conf, api_mock)
         await getattr(exchange, fun)(**kwargs)
     assert api_mock.__dict__[mock_ccxt_fun].call_count == retries
 
     with pytest.raises(OperationalException):
         api_mock.__dict__[mock_ccxt_fun] = MagicMock(side_effect=ccxt.BaseError("DeadBeef"))
-        exchange = get_patched_exchange(mocker, default_conf, api_mock)
         await getattr(exchange, fun)(**kwargs)
     assert api_mock.__dict__[mock_ccxt_fun].call_count == 1
 
@@ -110,6 +107,16 @@ def test_init_ccxt_kwargs(default_conf, mocker, caplog):
     assert log_has(asynclogmsg, caplog)
 
 
+def test_init_ccxt_session_pool(default_conf, mocker):
+    mocker.patch('freqtrade.exchange.Exchange._load_markets', MagicMock(return_value={}))
+    mocker.patch('freqtrade.exchange.Exchange.validate_stakecurrency')
+    ex = Exchange(default_conf)
+    adapter = ex._api.session.get_adapter('https://api.binance.com')
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+    # Same adapter (and connection pool) for all requests
+    assert ex._api.session.get_adapter('https://api.binance.com/api/v3/ticker') is adapter
+
+
 def test_destroy(default_conf, mocker, caplog):
     caplog.set_level(logging.DEBUG)
     get_patched_exchange(mocker, default_conf)
@@ -1359,6 +1366,16 @@ def test_fetch_ticker(default_conf, mocker, exchange_name):
     assert ticker['bid'] == 0.5
     assert ticker['ask'] == 1
 
+    # Cached ticker is reused
+    ticker = exchange.fetch_ticker(pair='ETH/BTC', cached=True)
+    assert api_mock.fetch_ticker.call_count == 1
+    assert ticker['bid'] == 0.5
+
+    # Placing an order drops the cached ticker
+    exchange.buy(pair='ETH/BTC', ordertype='limit', amount=1, rate=0.5, time_in_force='gtc')
+    exchange.fetch_ticker(pair='ETH/BTC', cached=True)
+    assert api_mock.fetch_ticker.call_count == 2
+
     ccxt_exceptionhandlers(mocker, default_conf, api_mock, exchange_name,
                            "fetch_ticker", "fetch_ticker",
                            pair='ETH/BTC')
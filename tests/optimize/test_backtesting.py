@@ -1,6 +1,6 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
 
-import random
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
@@ -22,8 +22,8 @@ from freqtrade.persistence import LocalTrade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.state import RunMode
 from freqtrade.strategy.interface import SellType
-from tests.conftest import (get_args, log_has, log_has_re, patch_exchange,
-                            patched_configuration_load_config_file)
+from tests.conftest import (get_args, get_default_conf, log_has, log_has_re, log_missing,
+                            patch_exchange, patched_configuration_load_config_file)
 
 
 ORDER_TYPES = [
@@ -40,52 +40,94 @@ ORDER_TYPES = [
         'stoploss_on_exchange': True
     }]
 
+# Expected trades of test_backtest_one - built once, only used for comparison
+BACKTEST_ONE_RESULTS = pd.DataFrame(
+    {'pair': ['UNITTEST/BTC', 'UNITTEST/BTC'],
+     'stake_amount': [0.001, 0.001],
+     'amount': [0.00957442, 0.0097064],
+     'open_date': pd.to_datetime([Arrow(2018, 1, 29, 18, 40, 0).datetime,
+                                  Arrow(2018, 1, 30, 3, 30, 0).datetime], utc=True
+                                 ),
+     'close_date': pd.to_datetime([Arrow(2018, 1, 29, 22, 35, 0).datetime,
+                                   Arrow(2018, 1, 30, 4, 10, 0).datetime], utc=True),
+     'open_rate': [0.104445, 0.10302485],
+     'close_rate': [0.104969, 0.103541],
+     'fee_open': [0.0025, 0.0025],
+     'fee_close': [0.0025, 0.0025],
+     'trade_duration': [235, 40],
+     'profit_ratio': [0.0, 0.0],
+     'profit_abs': [0.0, 0.0],
+     'sell_reason': [SellType.ROI.value, SellType.ROI.value],
+     'initial_stop_loss_abs': [0.0940005, 0.09272236],
+     'initial_stop_loss_ratio': [-0.1, -0.1],
+     'stop_loss_abs': [0.0940005, 0.09272236],
+     'stop_loss_ratio': [-0.1, -0.1],
+     'min_rate': [0.1038, 0.10302485],
+     'max_rate': [0.10501, 0.1038888],
+     'is_open': [False, False],
+     })
+
 
 def trim_dictlist(dict_list, num):
-    new = {}
-    for pair, pair_data in dict_list.items():
-        new[pair] = pair_data[num:].reset_index()
-    return new
+    return {pair: pair_data[num:].reset_index() for pair, pair_data in dict_list.items()}
 
 
-def load_data_test(what, testdatadir):
+@lru_cache(maxsize=4)
+def _load_unittest_history(testdatadir):
     timerange = TimeRange.parse_timerange('1510694220-1510700340')
-    data = history.load_pair_history(pair='UNITTEST/BTC', datadir=testdatadir,
+    return history.load_pair_history(pair='UNITTEST/BTC', datadir=testdatadir,
                                      timeframe='1m', timerange=timerange,
                                      drop_incomplete=False,
                                      fill_up_missing=False)
 
+
+def load_data_test(what, testdatadir):
+    # Parse the datafile only once - callers modify the data, so hand out a copy
+    data = _load_unittest_history(testdatadir).copy()
+
     base = 0.001
+    # Compute the price curve once per variant, high / low are offsets of it
+    price = None
     if what == 'raise':
-        data.loc[:, 'open'] = data.index * base
-        data.loc[:, 'high'] = data.index * base + 0.0001
-        data.loc[:, 'low'] = data.index * base - 0.0001
-        data.loc[:, 'close'] = data.index * base
+        price = data.index.to_numpy() * base
 
     if what == 'lower':
-        data.loc[:, 'open'] = 1 - data.index * base
-        data.loc[:, 'high'] = 1 - data.index * base + 0.0001
-        data.loc[:, 'low'] = 1 - data.index * base - 0.0001
-        data.loc[:, 'close'] = 1 - data.index * base
+        price = 1 - data.index.to_numpy() * base
 
     if what == 'sine':
         hz = 0.1  # frequency
-        data.loc[:, 'open'] = np.sin(data.index * hz) / 1000 + base
-        data.loc[:, 'high'] = np.sin(data.index * hz) / 1000 + base + 0.0001
-        data.loc[:, 'low'] = np.sin(data.index * hz) / 1000 + base - 0.0001
-        data.loc[:, 'close'] = np.sin(data.index * hz) / 1000 + base
+        price = np.sin(data.index.to_numpy() * hz) / 1000 + base
+
+    if price is not None:
+        data.loc[:, 'open'] = price
+        data.loc[:, 'high'] = price + 0.0001
+        data.loc[:, 'low'] = price - 0.0001
+        data.loc[:, 'close'] = price
 
     return {'UNITTEST/BTC': clean_ohlcv_dataframe(data, timeframe='1m', pair='UNITTEST/BTC',
                                                   fill_missing=True)}
 
 
+@lru_cache(maxsize=8)
+def _load_processed_contour(contour, testdatadir, strategy, strategy_path, timeframe):
+    # Indicators only depend on the contour data and the strategy - compute them once.
+    # Everything used to load the strategy is part of the cache key.
+    config = get_default_conf(testdatadir)
+    config.update({'strategy': strategy, 'strategy_path': strategy_path,
+                   'timeframe': timeframe})
+    strategy = StrategyResolver.load_strategy(config)
+    return strategy.ohlcvdata_to_dataframe(load_data_test(contour, testdatadir))
+
+
 def simple_backtest(config, contour, mocker, testdatadir) -> None:
     patch_exchange(mocker)
     config['timeframe'] = '1m'
     backtesting = Backtesting(config)
 
-    data = load_data_test(contour, testdatadir)
-    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+    processed = _load_processed_contour(contour, testdatadir, config['strategy'],
+                                        config.get('strategy_path'), config['timeframe'])
+    # backtest() writes buy / sell columns into the processed frames
+    processed = {pair: df.copy() for pair, df in processed.items()}
     min_date, max_date = get_timerange(processed)
     assert isinstance(processed, dict)
     results = backtesting.backtest(
@@ -100,15 +142,18 @@ def simple_backtest(config, contour, mocker, testdatadir) -> None:
     return results
 
 
-# FIX: fixturize this?
 def _make_backtest_conf(mocker, datadir, conf=None, pair='UNITTEST/BTC'):
+    """
+    Build a Backtesting instance and the matching backtest() arguments.
+    The instance is returned so tests don't have to construct a second one.
+    """
     data = history.load_data(datadir=datadir, timeframe='1m', pairs=[pair])
     data = trim_dictlist(data, -201)
     patch_exchange(mocker)
     backtesting = Backtesting(conf)
     processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
     min_date, max_date = get_timerange(processed)
-    return {
+    return backtesting, {
         'processed': processed,
         'start_date': min_date,
         'end_date': max_date,
@@ -117,35 +162,89 @@ def _make_backtest_conf(mocker, datadir, conf=None, pair='UNITTEST/BTC'):
     }
 
 
+@lru_cache(maxsize=4)
+def _load_multi_pair_data(testdatadir):
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    # Only use 500 lines to increase performance
+    return trim_dictlist(data, -500)
+
+
 def _trend(signals, buy_value, sell_value):
     n = len(signals['low'])
-    buy = np.zeros(n)
-    sell = np.zeros(n)
-    for i in range(0, len(signals['buy'])):
-        if random.random() > 0.5:  # Both buy and sell signals at same timeframe
-            buy[i] = buy_value
-            sell[i] = sell_value
+    # Both buy and sell signals at same timeframe
+    # Seeded per call, so the signals don't depend on which test ran before
+    mask = np.random.default_rng(0).random(n) > 0.5
+    buy = np.zeros(n, dtype=np.int8)
+    sell = np.zeros(n, dtype=np.int8)
+    buy[mask] = buy_value
+    sell[mask] = sell_value
     signals['buy'] = buy
     signals['sell'] = sell
     return signals
 
 
 def _trend_alternate(dataframe=None, metadata=None):
-    signals = dataframe
-    low = signals['low']
-    n = len(low)
-    buy = np.zeros(n)
-    sell = np.zeros(n)
-    for i in range(0, len(buy)):
-        if i % 2 == 0:
-            buy[i] = 1
-        else:
-            sell[i] = 1
-    signals['buy'] = buy
-    signals['sell'] = sell
+    n = len(dataframe['low'])
+    # Buy on even, sell on odd candles
+    buy = np.zeros(n, dtype=np.int8)
+    sell = np.zeros(n, dtype=np.int8)
+    buy[0::2] = 1
+    sell[1::2] = 1
+    dataframe['buy'] = buy
+    dataframe['sell'] = sell
     return dataframe
 
 
+def _backtest_start_log_lines(testdatadir):
+    """Log lines expected from every backtest-start run over the shared cli options"""
+    return [
+        'Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
+        'Ignoring max_open_trades (--disable-max-market-positions was used) ...',
+        'Parameter --timerange detected: 1510694220-1510700340 ...',
+        f'Using data directory: {testdatadir} ...',
+        'Loading data from 2017-11-14 20:57:00 '
+        'up to 2017-11-14 22:58:00 (0 days)..',
+        'Backtesting with data from 2017-11-14 21:17:00 '
+        'up to 2017-11-14 22:58:00 (0 days)..',
+        'Parameter --enable-position-stacking detected ...'
+    ]
+
+
+def _start_multi_strat(mocker, default_conf, caplog, testdatadir, backtestmock) -> None:
+    """
+    Run start_backtesting for DefaultStrategy and TestStrategyLegacy,
+    with Backtesting.backtest replaced by backtestmock.
+    """
+    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC']))
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest', backtestmock)
+    patched_configuration_load_config_file(mocker, default_conf)
+
+    args = [
+        'backtesting',
+        '--config', 'config.json',
+        '--datadir', str(testdatadir),
+        '--strategy-path', str(Path(__file__).parents[1] / 'strategy/strats'),
+        '--timeframe', '1m',
+        '--timerange', '1510694220-1510700340',
+        '--enable-position-stacking',
+        '--disable-max-market-positions',
+        '--strategy-list',
+        'DefaultStrategy',
+        'TestStrategyLegacy',
+    ]
+    args = get_args(args)
+    start_backtesting(args)
+
+    # check the logs, that will contain the backtest result
+    exists = _backtest_start_log_lines(testdatadir) + [
+        'Running backtesting for Strategy DefaultStrategy',
+        'Running backtesting for Strategy TestStrategyLegacy',
+    ]
+    assert not log_missing(exists, caplog)
+
+
 # Unit tests
 def test_setup_optimize_configuration_without_arguments(mocker, default_conf, caplog) -> None:
     patched_configuration_load_config_file(mocker, default_conf)
@@ -368,8 +467,7 @@ def test_backtesting_start(default_conf, mocker, testdatadir, caplog) -> None:
         'Backtesting with data from 2017-11-14 21:17:00 '
         'up to 2017-11-14 22:59:00 (0 days)..'
     ]
-    for line in exists:
-        assert log_has(line, caplog)
+    assert not log_missing(exists, caplog)
     assert backtesting.strategy.dp._pairlists is not None
     assert backtesting.strategy.bot_loop_start.call_count == 1
     assert sbs.call_count == 1
@@ -525,43 +623,17 @@ def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
     assert not results.empty
     assert len(results) == 2
 
-    expected = pd.DataFrame(
-        {'pair': [pair, pair],
-         'stake_amount': [0.001, 0.001],
-         'amount': [0.00957442, 0.0097064],
-         'open_date': pd.to_datetime([Arrow(2018, 1, 29, 18, 40, 0).datetime,
-                                      Arrow(2018, 1, 30, 3, 30, 0).datetime], utc=True
-                                     ),
-         'close_date': pd.to_datetime([Arrow(2018, 1, 29, 22, 35, 0).datetime,
-                                       Arrow(2018, 1, 30, 4, 10, 0).datetime], utc=True),
-         'open_rate': [0.104445, 0.10302485],
-         'close_rate': [0.104969, 0.103541],
-         'fee_open': [0.0025, 0.0025],
-         'fee_close': [0.0025, 0.0025],
-         'trade_duration': [235, 40],
-         'profit_ratio': [0.0, 0.0],
-         'profit_abs': [0.0, 0.0],
-         'sell_reason': [SellType.ROI.value, SellType.ROI.value],
-         'initial_stop_loss_abs': [0.0940005, 0.09272236],
-         'initial_stop_loss_ratio': [-0.1, -0.1],
-         'stop_loss_abs': [0.0940005, 0.09272236],
-         'stop_loss_ratio': [-0.1, -0.1],
-         'min_rate': [0.1038, 0.10302485],
-         'max_rate': [0.10501, 0.1038888],
-         'is_open': [False, False],
-         })
-    pd.testing.assert_frame_equal(results, expected)
-    data_pair = processed[pair]
-    for _, t in results.iterrows():
-        ln = data_pair.loc[data_pair["date"] == t["open_date"]]
-        # Check open trade rate alignes to open rate
-        assert ln is not None
-        assert round(ln.iloc[0]["open"], 6) == round(t["open_rate"], 6)
-        # check close trade rate alignes to close rate or is between high and low
-        ln = data_pair.loc[data_pair["date"] == t["close_date"]]
-        assert (round(ln.iloc[0]["open"], 6) == round(t["close_rate"], 6) or
-                round(ln.iloc[0]["low"], 6) < round(
-                t["close_rate"], 6) < round(ln.iloc[0]["high"], 6))
+    pd.testing.assert_frame_equal(results, BACKTEST_ONE_RESULTS)
+    data_pair = processed[pair].set_index('date')
+    # Check open trade rate alignes to open rate
+    open_candles = data_pair.loc[results['open_date']]
+    assert (open_candles['open'].round(6).values == results['open_rate'].round(6).values).all()
+    # check close trade rate alignes to close rate or is between high and low
+    close_candles = data_pair.loc[results['close_date']].round(6)
+    close_rate = results['close_rate'].round(6).values
+    assert ((close_candles['open'].values == close_rate)
+            | ((close_candles['low'].values < close_rate)
+               & (close_rate < close_candles['high'].values))).all()
 
 
 def test_backtest_1min_timeframe(default_conf, fee, mocker, testdatadir) -> None:
@@ -659,8 +731,8 @@ def test_backtest_clash_buy_sell(mocker, default_conf, testdatadir):
         sell_value = 1
         return _trend(dataframe, buy_value, sell_value)
 
-    backtest_conf = _make_backtest_conf(mocker, conf=default_conf, datadir=testdatadir)
-    backtesting = Backtesting(default_conf)
+    backtesting, backtest_conf = _make_backtest_conf(mocker, conf=default_conf,
+                                                     datadir=testdatadir)
     backtesting.strategy.advise_buy = fun  # Override
     backtesting.strategy.advise_sell = fun  # Override
     result = backtesting.backtest(**backtest_conf)
@@ -674,8 +746,8 @@ def test_backtest_only_sell(mocker, default_conf, testdatadir):
         sell_value = 1
         return _trend(dataframe, buy_value, sell_value)
 
-    backtest_conf = _make_backtest_conf(mocker, conf=default_conf, datadir=testdatadir)
-    backtesting = Backtesting(default_conf)
+    backtesting, backtest_conf = _make_backtest_conf(mocker, conf=default_conf,
+                                                     datadir=testdatadir)
     backtesting.strategy.advise_buy = fun  # Override
     backtesting.strategy.advise_sell = fun  # Override
     result = backtesting.backtest(**backtest_conf)
@@ -685,10 +757,9 @@ def test_backtest_only_sell(mocker, default_conf, testdatadir):
 def test_backtest_alternate_buy_sell(default_conf, fee, mocker, testdatadir):
     mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
-    backtest_conf = _make_backtest_conf(mocker, conf=default_conf,
-                                        pair='UNITTEST/BTC', datadir=testdatadir)
     default_conf['timeframe'] = '1m'
-    backtesting = Backtesting(default_conf)
+    backtesting, backtest_conf = _make_backtest_conf(mocker, conf=default_conf,
+                                                     pair='UNITTEST/BTC', datadir=testdatadir)
     backtesting.strategy.advise_buy = _trend_alternate  # Override
     backtesting.strategy.advise_sell = _trend_alternate  # Override
     result = backtesting.backtest(**backtest_conf)
@@ -713,18 +784,22 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
             multi = 20
         else:
             multi = 18
-        dataframe['buy'] = np.where(dataframe.index % multi == 0, 1, 0)
-        dataframe['sell'] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        # dataframe.index is a RangeIndex starting at 0 - use slices instead of modulo masks
+        n = len(dataframe)
+        buy = np.zeros(n, dtype=np.int8)
+        sell = np.zeros(n, dtype=np.int8)
+        buy[0::multi] = 1
+        sell[2::multi] = 1
+        dataframe['buy'] = buy
+        dataframe['sell'] = sell
         return dataframe
 
     mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
     patch_exchange(mocker)
 
-    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
-    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
-    # Only use 500 lines to increase performance
-    data = trim_dictlist(data, -500)
+    # The cached frames are never modified (ohlcvdata_to_dataframe copies) - copy the dict only
+    data = dict(_load_multi_pair_data(testdatadir))
 
     # Remove data for one pair from the beginning of the data
     data[pair] = data[pair][tres:].reset_index()
@@ -785,20 +860,7 @@ def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
     args = get_args(args)
     start_backtesting(args)
     # check the logs, that will contain the backtest result
-    exists = [
-        'Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
-        'Ignoring max_open_trades (--disable-max-market-positions was used) ...',
-        'Parameter --timerange detected: 1510694220-1510700340 ...',
-        f'Using data directory: {testdatadir} ...',
-        'Loading data from 2017-11-14 20:57:00 '
-        'up to 2017-11-14 22:58:00 (0 days)..',
-        'Backtesting with data from 2017-11-14 21:17:00 '
-        'up to 2017-11-14 22:58:00 (0 days)..',
-        'Parameter --enable-position-stacking detected ...'
-    ]
-
-    for line in exists:
-        assert log_has(line, caplog)
+    assert not log_missing(_backtest_start_log_lines(testdatadir), caplog)
 
 
 @pytest.mark.filterwarnings("ignore:deprecated")
@@ -817,9 +879,6 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
         'locks': [],
         'final_balance': 1000,
         })
-    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
-                 PropertyMock(return_value=['UNITTEST/BTC']))
-    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest', backtestmock)
     text_table_mock = MagicMock()
     sell_reason_mock = MagicMock()
     strattable_mock = MagicMock()
@@ -833,23 +892,7 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
                           generate_strategy_comparison=strat_summary,
                           generate_daily_stats=MagicMock(),
                           )
-    patched_configuration_load_config_file(mocker, default_conf)
-
-    args = [
-        'backtesting',
-        '--config', 'config.json',
-        '--datadir', str(testdatadir),
-        '--strategy-path', str(Path(__file__).parents[1] / 'strategy/strats'),
-        '--timeframe', '1m',
-        '--timerange', '1510694220-1510700340',
-        '--enable-position-stacking',
-        '--disable-max-market-positions',
-        '--strategy-list',
-        'DefaultStrategy',
-        'TestStrategyLegacy',
-    ]
-    args = get_args(args)
-    start_backtesting(args)
+    _start_multi_strat(mocker, default_conf, caplog, testdatadir, backtestmock)
     # 2 backtests, 4 tables
     assert backtestmock.call_count == 2
     assert text_table_mock.call_count == 4
@@ -857,24 +900,6 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
     assert sell_reason_mock.call_count == 2
     assert strat_summary.call_count == 1
 
-    # check the logs, that will contain the backtest result
-    exists = [
-        'Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
-        'Ignoring max_open_trades (--disable-max-market-positions was used) ...',
-        'Parameter --timerange detected: 1510694220-1510700340 ...',
-        f'Using data directory: {testdatadir} ...',
-        'Loading data from 2017-11-14 20:57:00 '
-        'up to 2017-11-14 22:58:00 (0 days)..',
-        'Backtesting with data from 2017-11-14 21:17:00 '
-        'up to 2017-11-14 22:58:00 (0 days)..',
-        'Parameter --enable-position-stacking detected ...',
-        'Running backtesting for Strategy DefaultStrategy',
-        'Running backtesting for Strategy TestStrategyLegacy',
-    ]
-
-    for line in exists:
-        assert log_has(line, caplog)
-
 
 @pytest.mark.filterwarnings("ignore:deprecated")
 def test_backtest_start_multi_strat_nomock(default_conf, mocker, caplog, testdatadir, capsys):
@@ -931,45 +956,7 @@ def test_backtest_start_multi_strat_nomock(default_conf, mocker, caplog, testdat
             'final_balance': 1000,
         }
     ])
-    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
-                 PropertyMock(return_value=['UNITTEST/BTC']))
-    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest', backtestmock)
-
-    patched_configuration_load_config_file(mocker, default_conf)
-
-    args = [
-        'backtesting',
-        '--config', 'config.json',
-        '--datadir', str(testdatadir),
-        '--strategy-path', str(Path(__file__).parents[1] / 'strategy/strats'),
-        '--timeframe', '1m',
-        '--timerange', '1510694220-1510700340',
-        '--enable-position-stacking',
-        '--disable-max-market-positions',
-        '--strategy-list',
-        'DefaultStrategy',
-        'TestStrategyLegacy',
-    ]
-    args = get_args(args)
-    start_backtesting(args)
-
-    # check the logs, that will contain the backtest result
-    exists = [
-        'Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
-        'Ignoring max_open_trades (--disable-max-market-positions was used) ...',
-        'Parameter --timerange detected: 1510694220-1510700340 ...',
-        f'Using data directory: {testdatadir} ...',
-        'Loading data from 2017-11-14 20:57:00 '
-        'up to 2017-11-14 22:58:00 (0 days)..',
-        'Backtesting with data from 2017-11-14 21:17:00 '
-        'up to 2017-11-14 22:58:00 (0 days)..',
-        'Parameter --enable-position-stacking detected ...',
-        'Running backtesting for Strategy DefaultStrategy',
-        'Running backtesting for Strategy TestStrategyLegacy',
-    ]
-
-    for line in exists:
-        assert log_has(line, caplog)
+    _start_multi_strat(mocker, default_conf, caplog, testdatadir, backtestmock)
 
     captured = capsys.readouterr()
     assert 'BACKTESTING REPORT' in captured.out
@@ -176,6 +176,36 @@ def test_rpc_trade_status(default_conf, ticker, fee, mocker) -> None:
     }
 
 
+@pytest.mark.parametrize('workers', [1, 4])
+def test_rpc_trade_status_open_orders(default_conf, ticker, fee, mocker, workers) -> None:
+    default_conf['internals'] = {'status_fetch_workers': workers}
+    fetch_order_mock = MagicMock(side_effect=lambda order_id, pair: {
+        'id': order_id, 'type': 'limit', 'side': order_id.split('_')[1], 'remaining': 1.0})
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        fetch_ticker=ticker,
+        get_fee=fee,
+        fetch_order=fetch_order_mock,
+    )
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf)
+    rpc = RPC(freqtradebot)
+    create_mock_trades(fee)
+
+    trades = Trade.get_open_trades()
+    with_orders = [trade for trade in trades if trade.open_order_id]
+    assert len(with_orders) > 1
+
+    results = rpc._rpc_trade_status()
+    assert len(results) == len(trades)
+    assert fetch_order_mock.call_count == len(with_orders)
+    for result in results:
+        if result['open_order_id']:
+            side = result['open_order_id'].split('_')[1]
+            assert result['open_order'] == f'(limit {side} rem=1.00000000)'
+        else:
+            assert result['open_order'] is None
+
+
 def test_rpc_status_table(default_conf, ticker, fee, mocker) -> None:
     mocker.patch.multiple(
         'freqtrade.rpc.fiat_convert.CoinGeckoAPI',
@@ -436,6 +466,34 @@ def test_rpc_trade_statistics(default_conf, ticker, ticker_sell_up, fee,
     assert isnan(stats['profit_all_coin'])
 
 
+def test_rpc_trade_statistics_start_date(mocker, default_conf, ticker, fee) -> None:
+    mocker.patch('freqtrade.rpc.rpc.CryptoToFiatConverter._find_price', return_value=15000.0)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        fetch_ticker=ticker,
+        get_fee=fee,
+    )
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf)
+    rpc = RPC(freqtradebot)
+    create_mock_trades(fee)
+
+    stats = rpc._rpc_trade_statistics('BTC', 'USD')
+    assert stats['closed_trade_count'] == 2
+    assert stats['trade_count'] == 6
+
+    # Only the trade closed within the last minute, open trades are always included
+    stats_window = rpc._rpc_trade_statistics('BTC', 'USD',
+                                             datetime.utcnow() - timedelta(minutes=1))
+    assert stats_window['closed_trade_count'] == 1
+    assert stats_window['trade_count'] == 5
+    assert stats_window['first_trade_timestamp'] == stats['first_trade_timestamp']
+    assert stats_window['best_pair'] == 'XRP/BTC'
+
+    stats_window = rpc._rpc_trade_statistics('BTC', 'USD', datetime.utcnow() + timedelta(days=1))
+    assert stats_window['closed_trade_count'] == 0
+    assert stats_window['best_pair'] == ''
+
+
 # Test that rpc_trade_statistics can handle trades that lacks
 # trade.open_rate (it is set to None)
 def test_rpc_trade_statistics_closed(mocker, default_conf, ticker, fee,
@@ -665,9 +665,9 @@ def test_api_profit(botclient, mocker, ticker, fee, markets):
                          'profit_all_coin': -44.0631579,
                          'profit_all_fiat': -543959.6842755,
                          'profit_all_percent_mean': -66.41,
-                         'profit_all_ratio_mean': -0.6641100666666667,
+                         'profit_all_ratio_mean': pytest.approx(-0.6641100666666667),
                          'profit_all_percent_sum': -398.47,
-                         'profit_all_ratio_sum': -3.9846604,
+                         'profit_all_ratio_sum': pytest.approx(-3.9846604),
                          'profit_closed_coin': 0.00073913,
                          'profit_closed_fiat': 9.124559849999999,
                          'profit_closed_ratio_mean': 0.0075,
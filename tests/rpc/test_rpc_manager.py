@@ -94,6 +94,25 @@ def test_send_msg_telegram_enabled(mocker, default_conf, caplog) -> None:
     assert telegram_mock.call_count == 1
 
 
+def test_reset_pair_performance(mocker, default_conf) -> None:
+    default_conf['telegram']['enabled'] = False
+    perf_mock = mocker.patch('freqtrade.persistence.Trade.get_overall_performance',
+                             MagicMock(return_value=[]))
+    rpc_manager = RPCManager(get_patched_freqtradebot(mocker, default_conf))
+
+    rpc_manager._rpc._rpc_performance()
+    rpc_manager._rpc._rpc_performance()
+    assert perf_mock.call_count == 1
+
+    rpc_manager.send_msg({'type': RPCMessageType.STATUS, 'status': 'test'})
+    rpc_manager._rpc._rpc_performance()
+    assert perf_mock.call_count == 1
+
+    rpc_manager.reset_pair_performance()
+    rpc_manager._rpc._rpc_performance()
+    assert perf_mock.call_count == 2
+
+
 def test_init_webhook_disabled(mocker, default_conf, caplog) -> None:
     caplog.set_level(logging.DEBUG)
     default_conf['telegram']['enabled'] = False
@@ -3,7 +3,7 @@
 # pragma pylint: disable=too-many-lines, too-many-arguments
 
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from random import choice, randint
 from string import ascii_uppercase
 from unittest.mock import ANY, MagicMock
@@ -88,6 +88,7 @@ def test_telegram_init(default_conf, mocker, caplog) -> None:
     # number of handles registered
     assert start_polling.dispatcher.add_handler.call_count > 0
     assert start_polling.start_polling.call_count == 1
+    assert start_polling.start_polling.call_args[1]['timeout'] == 20
 
     message_str = ("rpc.telegram is listening for following commands: [['status'], ['profit'], "
                    "['balance'], ['start'], ['stop'], ['forcesell'], ['forcebuy'], ['trades'], "
@@ -99,6 +100,12 @@ def test_telegram_init(default_conf, mocker, caplog) -> None:
 
     assert log_has(message_str, caplog)
 
+    # Poll timeout is capped at Telegram's maximum
+    start_polling.reset_mock()
+    default_conf['telegram']['poll_timeout'] = 120
+    get_telegram_testobject(mocker, default_conf, mock=False)
+    assert start_polling.start_polling.call_args[1]['timeout'] == 50
+
 
 def test_cleanup(default_conf, mocker, ) -> None:
     updater_mock = MagicMock()
@@ -471,6 +478,17 @@ def test_profit_handle(default_conf, update, ticker, ticker_sell_up, fee,
 
     assert '*Best Performing:* `ETH/BTC: 6.20%`' in msg_mock.call_args_list[-1][0][0]
 
+    # Trade closed before the requested window
+    trade.close_date = datetime.utcnow() - timedelta(days=3)
+    context = MagicMock()
+    context.args = ["2"]
+    telegram._profit(update=update, context=context)
+    assert 'No trades yet.' in msg_mock.call_args_list[-1][0][0]
+
+    context.args = ["5"]
+    telegram._profit(update=update, context=context)
+    assert '*ROI:* Closed trades' in msg_mock.call_args_list[-1][0][0]
+
 
 def test_telegram_stats(default_conf, update, ticker, ticker_sell_up, fee,
                         limit_buy_order, limit_sell_order, mocker) -> None:
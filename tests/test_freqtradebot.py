@@ -518,6 +518,7 @@ def test_create_trade_no_signal(default_conf, fee, mocker) -> None:
 
     Trade.query = MagicMock()
     Trade.query.filter = MagicMock()
+    Trade.query.filter.return_value.count.return_value = 0
     assert not freqtrade.create_trade('ETH/BTC')
 
 
@@ -1834,6 +1835,8 @@ def test_update_trade_state_sell(default_conf, trades_for_order, limit_sell_orde
     # Wallet needs to be updated after closing a limit-sell order to reenable buying
     assert wallet_mock.call_count == 1
     assert not trade.is_open
+    # Closed trade changes the pair performance
+    assert freqtrade.rpc.reset_pair_performance.call_count == 1
     # Order is updated by update_trade_state
     assert order.status == 'closed'
 
@@ -2513,6 +2516,7 @@ def test_handle_cancel_sell_limit(mocker, default_conf, fee) -> None:
         cancel_order=cancel_order_mock,
     )
     mocker.patch('freqtrade.freqtradebot.FreqtradeBot.get_sell_rate', return_value=0.245441)
+    reset_mock = mocker.patch('freqtrade.rpc.RPC.reset_pair_performance')
 
     freqtrade = FreqtradeBot(default_conf)
 
@@ -2533,6 +2537,8 @@ def test_handle_cancel_sell_limit(mocker, default_conf, fee) -> None:
     assert freqtrade.handle_cancel_sell(trade, order, reason)
     assert cancel_order_mock.call_count == 1
     assert send_msg_mock.call_count == 1
+    # Re-opened trade changes the pair performance
+    assert reset_mock.call_count == 1
 
     send_msg_mock.reset_mock()
 
@@ -2547,6 +2553,7 @@ def test_handle_cancel_sell_limit(mocker, default_conf, fee) -> None:
     # Message should not be iterated again
     assert trade.sell_order_status == CANCEL_REASON['PARTIALLY_FILLED_KEEP_OPEN']
     assert send_msg_mock.call_count == 1
+    assert reset_mock.call_count == 1
 
 
 def test_handle_cancel_sell_cancel_exception(mocker, default_conf) -> None:
@@ -4163,6 +4170,44 @@ def test_get_sell_rate_exception(default_conf, mocker, caplog):
     assert ft.get_sell_rate(pair, True) == 0.13
 
 
+def test_refresh_sell_rates(default_conf, mocker, caplog):
+    default_conf['ask_strategy']['price_side'] = 'bid'
+    ticker_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_ticker',
+                               return_value={'ask': 0.13, 'bid': 0.12, 'last': None})
+    tickers_mock = mocker.patch('freqtrade.exchange.Exchange.get_tickers', return_value={
+        'ETH/BTC': {'ask': 0.13, 'bid': 0.12, 'last': None},
+        'LTC/BTC': {'ask': 0.0051, 'bid': 0.005, 'last': None},
+        'XRP/BTC': {'ask': None, 'bid': None, 'last': None},
+    })
+    mocker.patch('freqtrade.exchange.Exchange.exchange_has', return_value=True)
+    ft = get_patched_freqtradebot(mocker, default_conf)
+
+    ft.refresh_sell_rates(['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'NEO/BTC'])
+    assert tickers_mock.call_count == 1
+    assert ft.get_sell_rate('ETH/BTC', False) == 0.12
+    assert ft.get_sell_rate('LTC/BTC', False) == 0.005
+    assert ticker_mock.call_count == 0
+    # Pairs missing from the batch fall back to fetch_ticker
+    assert ft.get_sell_rate('NEO/BTC', False) == 0.12
+    assert ticker_mock.call_count == 1
+
+    # All pairs cached - no further calls
+    ft.refresh_sell_rates(['ETH/BTC', 'LTC/BTC', 'NEO/BTC'])
+    assert tickers_mock.call_count == 1
+
+    # Orderbook mode does not use tickers
+    ft._sell_rate_cache.clear()
+    ft.config['ask_strategy']['use_order_book'] = True
+    ft.refresh_sell_rates(['ETH/BTC', 'LTC/BTC'])
+    assert tickers_mock.call_count == 1
+
+    ft.config['ask_strategy']['use_order_book'] = False
+    tickers_mock.side_effect = ExchangeError("Network error")
+    ft.refresh_sell_rates(['ETH/BTC', 'LTC/BTC'])
+    assert log_has("Could not fetch tickers in batch: Network error", caplog)
+    assert 'ETH/BTC' not in ft._sell_rate_cache
+
+
 def test_startup_state(default_conf, mocker):
     default_conf['pairlist'] = {'method': 'VolumePairList',
                                 'config': {'number_assets': 20}
@@ -7,7 +7,7 @@ from unittest.mock import MagicMock
 
 import arrow
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 
 from freqtrade import constants
 from freqtrade.exceptions import DependencyException, OperationalException
@@ -690,6 +690,22 @@ def test_migrate_mid_state(mocker, default_conf, fee, caplog):
     assert log_has("Running database migration for trades - backup: trades_bak0", caplog)
 
 
+def test_migrate_missing_index(mocker, default_conf, caplog):
+    """
+    Test creation of indexes added after the table was created
+    """
+    engine = create_engine('sqlite://')
+    mocker.patch('freqtrade.persistence.models.create_engine', lambda *args, **kwargs: engine)
+
+    init_db(default_conf['db_url'], default_conf['dry_run'])
+    assert not log_has("Creating index ix_trades_guard on trades.", caplog)
+    engine.execute("drop index ix_trades_guard")
+
+    init_db(default_conf['db_url'], default_conf['dry_run'])
+    assert log_has("Creating index ix_trades_guard on trades.", caplog)
+    assert 'ix_trades_guard' in [ix['name'] for ix in inspect(engine).get_indexes('trades')]
+
+
 def test_adjust_stop_loss(fee):
     trade = Trade(
         pair='ETH/BTC',
@@ -781,6 +797,7 @@ def test_get_open(fee, use_db):
 
     create_mock_trades(fee, use_db)
     assert len(Trade.get_open_trades()) == 4
+    assert Trade.get_open_trade_count() == 4
 
     Trade.use_db = True
 